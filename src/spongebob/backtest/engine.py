@@ -1,10 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
-from ..config import SETTINGS
+from ..config import Settings, get_settings
 from ..strategy.mtf_momo import MTFMomentum, Params
+from .intrabar import IntrabarResolver
 
 @dataclass
 class Trade:
@@ -20,11 +21,46 @@ class Trade:
     stop: float
     take: float
 
+@dataclass(frozen=True)
+class Gating:
+    """Pfadabhängige Entry-Gates (wie Settings.cooldown_bars / trade_hours)."""
+    cooldown_bars: int = 0                 # 0 = aus; Wartezeit in 1m-Bars nach Exit
+    trade_hours: Tuple[int, ...] = ()      # leer = keine Einschränkung
+
+    @classmethod
+    def from_settings(cls, settings) -> "Gating":
+        return cls(int(getattr(settings, "cooldown_bars", 0)),
+                   tuple(sorted(set(getattr(settings, "trade_hours", [])))))
+
+@dataclass
+class CandidateEvents:
+    """
+    Alle möglichen Einstiege eines Symbols (einmal pro Params-Set aufgezeichnet).
+    Exit-Bar und Exit-Level hängen nur vom Entry ab, nicht vom Gating –
+    daher kann replay() beliebige Gating-Varianten ohne Strategie-Neuberechnung abspielen.
+    """
+    symbol: str
+    index: pd.DatetimeIndex        # 1m-Grid (für die Equity-Kurve)
+    closes: np.ndarray
+    entry_idx: np.ndarray          # Bar-Index des Signals
+    signal: np.ndarray             # +1 / -1
+    stop: np.ndarray
+    take: np.ndarray
+    exit_idx: np.ndarray           # erster Bar mit Stop/Take-Berührung; len(index) = kein Exit
+    exit_level: np.ndarray         # Stop oder Take (vor Slippage)
+    ambiguous: np.ndarray = field(default=None)  # Bar berührt Stop und Take
+    resolved: np.ndarray = field(default=None)   # davon per Intrabar-Daten aufgelöst
+
+    def __len__(self) -> int:
+        return len(self.entry_idx)
+
 class SimpleFuturesBacktester:
-    def __init__(self, equity: float = 10_000.0, settings=SETTINGS, params: Params = Params()):
+    def __init__(self, equity: float = 10_000.0, settings: Optional[Settings] = None, params: Params = Params(),
+                 intrabar: Optional[IntrabarResolver] = None):
         self.equity0 = equity
-        self.settings = settings
+        self.settings = settings if settings is not None else get_settings()
         self.params = params
+        self.intrabar = intrabar  # None = immer Stop zuerst bei mehrdeutigen Bars
 
     def _apply_slippage(self, price: float, side: str) -> float:
         ticks = self.settings.slippage_ticks
@@ -54,6 +90,8 @@ class SimpleFuturesBacktester:
         cooldown_bars = int(getattr(self.settings, "cooldown_bars", 0))
         trade_hours = set(getattr(self.settings, "trade_hours", []))
         cooldown_until: Optional[pd.Timestamp] = None
+        n_ambiguous = 0            # Bars, die Stop und Take gleichzeitig berühren
+        n_resolved = 0             # davon per 1s/aggTrades aufgelöst
 
         # Pre-extract arrays (viel schneller als iterrows)
         index = df_1m.index
@@ -86,19 +124,27 @@ class SimpleFuturesBacktester:
             # manage exit
             if position != 0:
                 if position > 0:
-                    if low <= curr_stop:
-                        exit_px = curr_stop
-                    elif high >= curr_take:
-                        exit_px = curr_take
-                    else:
-                        exit_px = None
+                    hit_stop = low <= curr_stop
+                    hit_take = high >= curr_take
                 else:  # short
-                    if high >= curr_stop:
-                        exit_px = curr_stop
-                    elif low <= curr_take:
-                        exit_px = curr_take
-                    else:
-                        exit_px = None
+                    hit_stop = high >= curr_stop
+                    hit_take = low <= curr_take
+
+                if hit_stop and hit_take:
+                    # Reihenfolge im Bar unbekannt → feinere Daten nur für diese Minute
+                    n_ambiguous += 1
+                    first = None
+                    if self.intrabar is not None:
+                        first = self.intrabar.resolve(symbol, ts, position, curr_stop, curr_take)
+                    if first is not None:
+                        n_resolved += 1
+                    exit_px = curr_take if first == "take" else curr_stop
+                elif hit_stop:
+                    exit_px = curr_stop
+                elif hit_take:
+                    exit_px = curr_take
+                else:
+                    exit_px = None
 
                 if exit_px is not None:
                     side = "sell" if position > 0 else "buy"
@@ -153,9 +199,142 @@ class SimpleFuturesBacktester:
         tdf = pd.DataFrame([t.__dict__ for t in trades])
 
         metrics = self._metrics(eq, tdf)
+        metrics["ambiguous_bars"] = n_ambiguous
+        metrics["intrabar_resolved"] = n_resolved
 
         return eq, tdf, metrics
 
+    def record_candidates(self, symbol: str, df_1m: pd.DataFrame) -> CandidateEvents:
+        """
+        Signale einmal berechnen und jeden möglichen Einstieg samt Exit aufzeichnen.
+        Gleiche Exit-Regeln wie run_symbol (inkl. Intrabar-Auflösung).
+        """
+        strat = MTFMomentum(self.params)
+        sig = strat.generate(df_1m)
+
+        index = df_1m.index
+        highs = df_1m["high"].to_numpy(dtype=float)
+        lows  = df_1m["low"].to_numpy(dtype=float)
+        closes= df_1m["close"].to_numpy(dtype=float)
+        signals = sig["signal"].to_numpy(dtype=float)
+        stops   = sig["stop"].to_numpy(dtype=float)
+        takes   = sig["take"].to_numpy(dtype=float)
+
+        ok = (np.isfinite(signals) & (signals != 0) & np.isfinite(stops) & np.isfinite(takes)
+              & (np.abs(closes - stops) > 0))
+        entry_idx = np.flatnonzero(ok)
+        n_ev = len(entry_idx)
+        exit_idx = np.full(n_ev, len(index), dtype=np.int64)
+        exit_level = np.full(n_ev, np.nan)
+        ambiguous = np.zeros(n_ev, dtype=bool)
+        resolved = np.zeros(n_ev, dtype=bool)
+
+        for k, i in enumerate(entry_idx):
+            position = 1 if signals[i] > 0 else -1
+            j, hit_stop, hit_take = _first_touch(highs, lows, i + 1, position, stops[i], takes[i])
+            if j >= len(index):
+                continue
+            exit_idx[k] = j
+            if hit_stop and hit_take:
+                ambiguous[k] = True
+                first = None
+                if self.intrabar is not None:
+                    first = self.intrabar.resolve(symbol, index[j], position, stops[i], takes[i])
+                resolved[k] = first is not None
+                exit_level[k] = takes[i] if first == "take" else stops[i]
+            else:
+                exit_level[k] = stops[i] if hit_stop else takes[i]
+
+        return CandidateEvents(symbol, index, closes, entry_idx,
+                               np.sign(signals[entry_idx]).astype(int),
+                               stops[entry_idx], takes[entry_idx], exit_idx, exit_level,
+                               ambiguous, resolved)
+
+    def replay(self, events: CandidateEvents, gating: Optional[Gating] = None) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
+        """
+        Gating + Positionsgrößen über die kompakte Event-Liste abspielen.
+        Ergebnis entspricht run_symbol mit denselben cooldown_bars/trade_hours.
+        """
+        gating = gating if gating is not None else Gating.from_settings(self.settings)
+        fees = self.settings.fees
+        risk = self.settings.risk
+        max_lev = risk.max_leverage
+        trade_hours = set(gating.trade_hours)
+
+        index = events.index
+        n = len(index)
+        closes = events.closes
+        ts_ns = index.asi8
+        hours = index.hour
+        cooldown_ns = pd.Timedelta(minutes=gating.cooldown_bars).value
+
+        equity = self.equity0
+        eq_arr = np.empty(n, dtype=float)
+        filled_upto = 0            # eq_arr[:filled_upto] ist geschrieben
+        busy_until = -1            # Exit-Bar der letzten Position (kein Entry bis inkl. diesem Bar)
+        cooldown_until = None
+        trades: List[Trade] = []
+        n_ambiguous = n_resolved = 0
+
+        for k in range(len(events)):
+            i = events.entry_idx[k]
+            if i <= busy_until:
+                continue
+            if cooldown_until is not None and ts_ns[i] < cooldown_until:
+                continue
+            if trade_hours and (hours[i] not in trade_hours):
+                continue
+
+            price_close = closes[i]
+            stop_now = events.stop[k]
+            atr_stop_dist = abs(price_close - stop_now)
+            risk_usdt = risk.risk_per_trade * equity
+            qty_est = risk_usdt / atr_stop_dist
+            notional = qty_est * price_close
+            if notional > equity * max_lev:
+                qty_est = (equity * max_lev) / price_close
+
+            position = int(events.signal[k])
+            filled_in = self._apply_slippage(price_close, "buy" if position > 0 else "sell")
+            entry_fee = abs(filled_in * qty_est) * fees.taker
+            qty = qty_est if position > 0 else -qty_est
+
+            eq_arr[filled_upto:i + 1] = equity     # flat bis inkl. Entry-Bar (MTM vor Entry)
+            equity -= entry_fee
+            j = int(events.exit_idx[k])
+            eq_arr[i + 1:j + 1] = equity + (closes[i + 1:j + 1] - filled_in) * qty
+            filled_upto = min(j + 1, n)
+            busy_until = j
+            if j >= n:
+                break              # Position bleibt bis Datenende offen
+
+            side = "sell" if position > 0 else "buy"
+            filled = self._apply_slippage(events.exit_level[k], side)
+            trade_fee = abs(filled * qty) * fees.taker
+            pnl = (filled - filled_in) * qty - trade_fee
+            equity += pnl
+            trades.append(Trade(index[i], index[j], "long" if position > 0 else "short",
+                                filled_in, filled, qty, pnl, trade_fee, events.symbol,
+                                float(stop_now), float(events.take[k])))
+            n_ambiguous += int(events.ambiguous[k])
+            n_resolved += int(events.resolved[k])
+            cooldown_until = ts_ns[j] + cooldown_ns if gating.cooldown_bars > 0 else None
+
+        eq_arr[filled_upto:] = equity
+
+        eq = pd.DataFrame({"equity": eq_arr}, index=index.rename("time"))
+        tdf = pd.DataFrame([t.__dict__ for t in trades])
+
+        metrics = self._metrics(eq, tdf)
+        metrics["ambiguous_bars"] = n_ambiguous
+        metrics["intrabar_resolved"] = n_resolved
+
+        return eq, tdf, metrics
+
+    def sweep_gating(self, events: CandidateEvents, gatings: List[Gating]) -> List[Dict]:
+        """Metriken je Gating-Variante aus einer einzigen Event-Aufzeichnung."""
+        return [self.replay(events, g)[2] for g in gatings]
+
     def _metrics(self, eq: pd.DataFrame, trades: pd.DataFrame) -> Dict:
         if eq.empty:
             return {"final_equity": self.equity0, "total_return": 0.0, "cagr": 0.0, "sharpe": 0.0, "max_drawdown": 0.0, "n_trades": 0}
@@ -181,3 +360,24 @@ class SimpleFuturesBacktester:
             "max_drawdown": float(max_dd),
             "n_trades": int(len(trades)) if trades is not None else 0
         }
+
+
+def _first_touch(highs: np.ndarray, lows: np.ndarray, start: int, position: int,
+                 stop: float, take: float, chunk: int = 512) -> Tuple[int, bool, bool]:
+    """Erster Bar ab `start`, der Stop oder Take berührt (fensterweise vektorisiert)."""
+    n = len(highs)
+    while start < n:
+        end = min(n, start + chunk)
+        if position > 0:
+            hs = lows[start:end] <= stop
+            ht = highs[start:end] >= take
+        else:
+            hs = highs[start:end] >= stop
+            ht = lows[start:end] <= take
+        hit = np.flatnonzero(hs | ht)
+        if len(hit):
+            k = hit[0]
+            return start + k, bool(hs[k]), bool(ht[k])
+        start = end
+        chunk *= 2
+    return n, False, False
@@ -0,0 +1,76 @@
+import os
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class IntrabarResolver:
+    """
+    Löst 1m-Bars auf, deren Range sowohl Stop als auch Take berührt.
+
+    Feinere Daten (1s-Klines oder aggTrades) werden nur für genau diese Minuten
+    geladen, aus einem lokalen Cache mit einer Datei pro Minute:
+        <base_dir>/<SYMBOL>/<subdir>/<YYYY-MM-DD>/<HHMM>.csv
+    - 1s-Klines: Spalten open_time, high, low (open/close optional)
+    - aggTrades: Spalten time, price
+    Fehlt die Datei oder ist die Reihenfolge auch dort nicht eindeutig,
+    liefert resolve() None → Engine nutzt die konservative Regel (Stop zuerst).
+    """
+    def __init__(self, base_dir: str = "data/raw/binance", subdir: str = "1s"):
+        self.base_dir = base_dir
+        self.subdir = subdir
+        self._cache: Dict[Tuple[str, pd.Timestamp], Optional[pd.DataFrame]] = {}
+
+    def minute_path(self, symbol: str, minute: pd.Timestamp) -> str:
+        return os.path.join(self.base_dir, symbol, self.subdir,
+                            minute.strftime("%Y-%m-%d"), minute.strftime("%H%M") + ".csv")
+
+    def load_minute(self, symbol: str, minute: pd.Timestamp) -> Optional[pd.DataFrame]:
+        minute = minute.floor("1min")
+        key = (symbol, minute)
+        if key in self._cache:
+            return self._cache[key]
+
+        path = self.minute_path(symbol, minute)
+        df = None
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            df = pd.read_csv(path)
+            time_col = "time" if "time" in df.columns else "open_time"
+            df[time_col] = pd.to_datetime(df[time_col], utc=True)
+            df = df.set_index(time_col).sort_index()
+            df = df.loc[(df.index >= minute) & (df.index < minute + pd.Timedelta(minutes=1))]
+            if df.empty:
+                df = None
+        self._cache[key] = df
+        return df
+
+    def resolve(self, symbol: str, minute: pd.Timestamp, position: int,
+                stop: float, take: float) -> Optional[str]:
+        """
+        position: +1 long, -1 short
+        Rückgabe: "stop" / "take" je nachdem was zuerst gefüllt wurde, sonst None
+        """
+        fine = self.load_minute(symbol, minute)
+        if fine is None:
+            return None
+
+        if "price" in fine.columns:
+            highs = lows = fine["price"].to_numpy(dtype=float)
+        else:
+            highs = fine["high"].to_numpy(dtype=float)
+            lows = fine["low"].to_numpy(dtype=float)
+
+        if position > 0:
+            hit_stop = lows <= stop
+            hit_take = highs >= take
+        else:
+            hit_stop = highs >= stop
+            hit_take = lows <= take
+
+        either = np.flatnonzero(hit_stop | hit_take)
+        if len(either) == 0:
+            return None
+        k = either[0]
+        if hit_stop[k] and hit_take[k]:
+            return None  # auch auf feinerer Ebene mehrdeutig
+        return "stop" if hit_stop[k] else "take"
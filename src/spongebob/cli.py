@@ -0,0 +1,43 @@
+"""
+Einheitlicher Einstiegspunkt: `spongebob <command> [args]`.
+
+Subcommands werden erst beim Aufruf importiert; dieses Modul selbst zieht
+nur die Standardbibliothek (kein pandas/numpy/pydantic), damit `--help` und
+Wrapper-Aufrufe aus Cron/Orchestrierung schnell starten.
+"""
+import importlib
+import sys
+
+# name -> (Modul mit main(argv, prog), Kurzbeschreibung)
+COMMANDS = {
+    "backtest":  ("spongebob.scripts.backtest",  "Run backtest for strategy."),
+    "optimize":  ("spongebob.scripts.optimize",  "Random-search optimizer (IS/OOS)."),
+    "portfolio": ("spongebob.scripts.portfolio", "Aggregate per-symbol equity into an equal-weight portfolio."),
+    "screen":    ("spongebob.scripts.screen",    "Screen a symbol universe: cheap prefilter, then parallel backtests."),
+    "download":  ("spongebob.scripts.download",  "Download Binance USDT-M futures klines."),
+}
+
+def _usage() -> str:
+    width = max(len(name) for name in COMMANDS)
+    lines = ["usage: spongebob <command> [args]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {desc}" for name, (_, desc) in COMMANDS.items()]
+    lines += ["", "Run `spongebob <command> --help` for command options."]
+    return "\n".join(lines)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(_usage())
+        return 0 if argv else 2
+
+    cmd, rest = argv[0], argv[1:]
+    if cmd not in COMMANDS:
+        print(f"spongebob: unknown command '{cmd}'\n", file=sys.stderr)
+        print(_usage(), file=sys.stderr)
+        return 2
+
+    module = importlib.import_module(COMMANDS[cmd][0])
+    return module.main(rest, prog=f"spongebob {cmd}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,13 @@
+from functools import lru_cache
+from typing import Optional
 from pydantic import BaseModel
-from dotenv import load_dotenv
-import os
 
-load_dotenv()
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """.env genau einmal laden – erst wenn Settings wirklich gebraucht werden."""
+    from dotenv import load_dotenv
+    load_dotenv()
 
 class Fees(BaseModel):
     taker: float = 0.0004  # 4 bps pro Seite
@@ -20,15 +25,22 @@ class Settings(BaseModel):
     slippage_ticks: int = 1
     tick_size: float = 0.1  # konservativ
     lot_size: float = 0.001
-class Settings(BaseModel):
-    fees: Fees = Fees()
-    risk: Risk = Risk()
-    slippage_ticks: int = 1
-    tick_size: float = 0.1
-    lot_size: float = 0.001
     # Neu in Loop 3:
     cooldown_bars: int = 0          # 0 = aus; sonst Wartezeit in 1m-Bars nach Exit
     trade_hours: list[int] = []     # z.B. [0,1,...,23]; leer = keine Einschränkung
 
 
-SETTINGS = Settings()
\ No newline at end of file
+_SETTINGS: Optional[Settings] = None
+
+def get_settings() -> Settings:
+    global _SETTINGS
+    if _SETTINGS is None:
+        load_env()
+        _SETTINGS = Settings()
+    return _SETTINGS
+
+def __getattr__(name: str):
+    # Rückwärtskompatibel: `from spongebob.config import SETTINGS` bleibt lazy
+    if name == "SETTINGS":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,11 @@
 import argparse
 import os
 import json
-import pandas as pd
-from ..backtest.engine import SimpleFuturesBacktester
-from ..strategy.mtf_momo import Params
 
-def load_1m_csv(symbol: str, base_dir: str = "data/raw/binance") -> pd.DataFrame:
+# pandas/Engine erst im Funktionsrumpf importieren → `spongebob backtest --help` bleibt schnell
+
+def load_1m_csv(symbol: str, base_dir: str = "data/raw/binance") -> "pd.DataFrame":
+    import pandas as pd
     path = os.path.join(base_dir, symbol, "1m.csv")
     if not os.path.exists(path):
         raise FileNotFoundError(f"1m data missing for {symbol}: {path}. Run download first.")
@@ -14,19 +14,29 @@ def load_1m_csv(symbol: str, base_dir: str = "data/raw/binance") -> pd.DataFrame
     df = df.set_index("open_time").sort_index()
     return df
 
-def slice_df(df: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
+def slice_df(df: "pd.DataFrame", start: str, end: str) -> "pd.DataFrame":
+    import pandas as pd
     s = pd.Timestamp(start, tz="UTC")
     e = pd.Timestamp(end, tz="UTC")
     return df.loc[(df.index >= s) & (df.index <= e)].copy()
 
-def main():
-    parser = argparse.ArgumentParser(description="Run backtest for strategy.")
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Run backtest for strategy.")
     parser.add_argument("--symbols", nargs="+", required=True)
     parser.add_argument("--start", required=True)
     parser.add_argument("--end", required=True)
     parser.add_argument("--equity", type=float, default=10000.0)
     parser.add_argument("--params_file", type=str, default=None, help="JSON file with Params overrides")
-    args = parser.parse_args()
+    parser.add_argument("--intrabar", action="store_true",
+                        help="Resolve bars touching stop and take via 1s/aggTrades cache")
+    parser.add_argument("--intrabar_dir", type=str, default="1s",
+                        help="Subdir per symbol holding per-minute fine data, e.g. 1s or aggTrades")
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+    from ..backtest.engine import SimpleFuturesBacktester
+    from ..backtest.intrabar import IntrabarResolver
+    from ..strategy.mtf_momo import Params
 
     params = Params()
     if args.params_file:
@@ -34,7 +44,8 @@ def main():
             overrides = json.load(f)
         params = Params(**overrides)
 
-    bt = SimpleFuturesBacktester(equity=args.equity, params=params)
+    intrabar = IntrabarResolver(subdir=args.intrabar_dir) if args.intrabar else None
+    bt = SimpleFuturesBacktester(equity=args.equity, params=params, intrabar=intrabar)
     curves = []
     all_trades = []
     metrics_list = []
@@ -53,6 +64,8 @@ def main():
         m = metrics.copy()
         m["symbol"] = sym
         metrics_list.append(m)
+        if m["ambiguous_bars"]:
+            print(f"{sym}: {m['intrabar_resolved']}/{m['ambiguous_bars']} ambiguous bars resolved intrabar.")
 
     if not curves:
         print("No results.")
@@ -1,10 +1,10 @@
-import argparse, os, json, random, pandas as pd, numpy as np
+import argparse, os, json, random
 from datetime import datetime
-from ..backtest.engine import SimpleFuturesBacktester
-from ..strategy.mtf_momo import Params
-from ..config import SETTINGS
+
+# pandas/numpy/Engine erst bei Bedarf importieren → `spongebob optimize --help` bleibt schnell
 
 def load_1m(symbol, base_dir="data/raw/binance"):
+    import pandas as pd
     path = os.path.join(base_dir, symbol, "1m.csv")
     if not os.path.exists(path):
         raise FileNotFoundError(f"Missing {path}. Run download first.")
@@ -13,10 +13,12 @@ def load_1m(symbol, base_dir="data/raw/binance"):
     return df.set_index("open_time").sort_index()
 
 def slice_df(df, start, end):
+    import pandas as pd
     s, e = pd.Timestamp(start, tz="UTC"), pd.Timestamp(end, tz="UTC")
     return df.loc[(df.index >= s) & (df.index <= e)].copy()
 
-def sample_params(rng: random.Random) -> Params:
+def sample_params(rng: random.Random) -> "Params":
+    from ..strategy.mtf_momo import Params
     c = rng.choice
     return Params(
         ema_fast_1m=c([7,9,12]),
@@ -44,6 +46,7 @@ def parse_hours(s: str):
     return [int(x) for x in s.split(",") if x != ""]
 
 def score(metrics_is, metrics_oos):
+    import numpy as np
     if not metrics_is or not metrics_oos:
         return -1e9
     sr_is  = np.mean([m["sharpe"] for m in metrics_is])
@@ -60,8 +63,8 @@ def score(metrics_is, metrics_oos):
         pen += (80 - n_tr) / 120.0
     return float(sr_is + 0.7*sr_oos - pen)
 
-def main():
-    ap = argparse.ArgumentParser(description="Random-search optimizer (IS/OOS).")
+def main(argv=None, prog=None):
+    ap = argparse.ArgumentParser(prog=prog, description="Random-search optimizer (IS/OOS).")
     ap.add_argument("--symbols", nargs="+", required=True)
     ap.add_argument("--start", required=True, help="IS start (UTC)")
     ap.add_argument("--split",  required=True, help="OOS start (UTC)")
@@ -69,13 +72,18 @@ def main():
     ap.add_argument("--n-trials", type=int, default=150)
     ap.add_argument("--equity", type=float, default=10000.0)
     ap.add_argument("--seed", type=int, default=42)
-    ap.add_argument("--cooldown", type=int, default=0, help="Cooldown in 1m bars after exit")
-    ap.add_argument("--hours", type=str, default="", help="Trading hours, e.g., '7-22' or '0,1,2,3,...'")
-    args = ap.parse_args()
+    ap.add_argument("--cooldown", type=int, nargs="+", default=[0],
+                    help="Cooldown(s) in 1m bars after exit, e.g. 0 15 60")
+    ap.add_argument("--hours", type=str, nargs="+", default=[""],
+                    help="Trading-hour window(s), e.g. '7-22' '0,1,2,3' ('' = all hours)")
+    args = ap.parse_args(argv)
+
+    import pandas as pd
+    from ..backtest.engine import SimpleFuturesBacktester, Gating
 
-    # Settings-Gates setzen
-    SETTINGS.cooldown_bars = int(args.cooldown)
-    SETTINGS.trade_hours   = parse_hours(args.hours)
+    # Gating-Raster: Events einmal pro Params-Set aufzeichnen, alle Varianten per Replay
+    gatings = [(cd, hrs, Gating(int(cd), tuple(sorted(set(parse_hours(hrs))))))
+               for hrs in args.hours for cd in args.cooldown]
 
     rng = random.Random(args.seed)
     data = {sym: load_1m(sym) for sym in args.symbols}
@@ -92,33 +100,44 @@ def main():
         p = sample_params(rng)
         bt = SimpleFuturesBacktester(equity=args.equity, params=p)
 
-        metrics_is, metrics_oos = [], []
+        ev_is, ev_oos = {}, {}
         for sym in args.symbols:
             if is_slices[sym].empty or oos_slices[sym].empty:
                 continue
-            _, _, m_is  = bt.run_symbol(sym, is_slices[sym])
-            _, _, m_oos = bt.run_symbol(sym, oos_slices[sym])
-            m_is["symbol"], m_oos["symbol"] = sym, sym
-            metrics_is.append(m_is); metrics_oos.append(m_oos)
-
-        s = score(metrics_is, metrics_oos)
-        row = {"trial": t, "score": s, "params": p.__dict__,
-               "is_metrics": metrics_is, "oos_metrics": metrics_oos}
-        rows.append(row)
-        if s > best["score"]:
-            best = row
+            ev_is[sym]  = bt.record_candidates(sym, is_slices[sym])
+            ev_oos[sym] = bt.record_candidates(sym, oos_slices[sym])
+
+        for cd, hrs, g in gatings:
+            metrics_is, metrics_oos = [], []
+            for sym in ev_is:
+                _, _, m_is  = bt.replay(ev_is[sym], g)
+                _, _, m_oos = bt.replay(ev_oos[sym], g)
+                m_is["symbol"], m_oos["symbol"] = sym, sym
+                metrics_is.append(m_is); metrics_oos.append(m_oos)
+
+            s = score(metrics_is, metrics_oos)
+            row = {"trial": t, "cooldown": cd, "hours": hrs, "score": s, "params": p.__dict__,
+                   "gating": {"cooldown_bars": g.cooldown_bars, "trade_hours": list(g.trade_hours)},
+                   "is_metrics": metrics_is, "oos_metrics": metrics_oos}
+            rows.append(row)
+            if s > best["score"]:
+                best = row
 
         if t % 10 == 0:
             print(f"Trial {t}/{args.n_trials}  best_score={best['score']:.3f}")
 
-    pd.DataFrame([{"trial": r["trial"], "score": r["score"], **r["params"]} for r in rows]) \
+    pd.DataFrame([{"trial": r["trial"], "cooldown": r["cooldown"], "hours": r["hours"],
+                   "score": r["score"], **r["params"]} for r in rows]) \
       .to_csv(os.path.join(outdir, "results.csv"), index=False)
     with open(os.path.join(outdir, "best_params.json"), "w", encoding="utf-8") as f:
         json.dump(best["params"], f, indent=2)
+    with open(os.path.join(outdir, "best_gating.json"), "w", encoding="utf-8") as f:
+        json.dump(best.get("gating", {}), f, indent=2)
 
     print("Saved:", outdir)
     print("Best score:", best["score"])
     print("Best params file:", os.path.join(outdir, "best_params.json"))
+    print("Best gating:", best.get("gating"))
 
 if __name__ == "__main__":
     main()
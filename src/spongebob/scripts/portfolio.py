@@ -1,11 +1,12 @@
-import os, json, pandas as pd, numpy as np
+import argparse, os, json
 
-def main():
-    import argparse
-    ap = argparse.ArgumentParser()
+def main(argv=None, prog=None):
+    ap = argparse.ArgumentParser(prog=prog, description="Aggregate per-symbol equity into an equal-weight portfolio.")
     ap.add_argument("--report_dir", default="reports/latest")
     ap.add_argument("--equity0", type=float, default=10000.0)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
+
+    import pandas as pd, numpy as np
 
     eq_path = os.path.join(args.report_dir, "equity.csv")
     if not os.path.exists(eq_path):
@@ -0,0 +1,190 @@
+import argparse, os, json, time
+from datetime import datetime
+
+# pandas/numpy/Engine erst bei Bedarf importieren → `spongebob screen --help` bleibt schnell
+
+PREFILTER_INTERVALS = ["3m", "15m", "30m", "1h"]
+
+def list_symbols(base_dir="data/raw/binance"):
+    if not os.path.isdir(base_dir):
+        return []
+    return sorted(d for d in os.listdir(base_dir)
+                  if os.path.exists(os.path.join(base_dir, d, "1m.csv")))
+
+def load_intervals(symbol, start, end, intervals=PREFILTER_INTERVALS, base_dir="data/raw/binance"):
+    """MTF-Bars laden; fehlende Intervalle aus 1m resamplen (1m wird höchstens einmal gelesen)."""
+    import pandas as pd
+    from ..utils.indicators import resample_ohlcv
+    from .backtest import load_1m_csv, slice_df
+
+    frames, df_1m = {}, None
+    for interval in intervals:
+        path = os.path.join(base_dir, symbol, f"{interval}.csv")
+        if os.path.exists(path):
+            df = pd.read_csv(path, usecols=["open_time", "open", "high", "low", "close", "volume"])
+            df["open_time"] = pd.to_datetime(df["open_time"], utc=True)
+            frames[interval] = slice_df(df.set_index("open_time").sort_index(), start, end)
+            continue
+        if df_1m is None:
+            df_1m = slice_df(load_1m_csv(symbol, base_dir), start, end)
+        frames[interval] = resample_ohlcv(df_1m, interval.replace("m", "min"))
+    return frames
+
+def prefilter_stats(bars, params):
+    """
+    Vektorisierter Vorfilter über alle Symbole gleichzeitig (Spalten = Symbole).
+    bars: {interval: {symbol: OHLCV-DataFrame}} für 3m, 15m, 30m, 1h
+    Liefert je Symbol:
+    - est_signals: Setups auf 3m (Trendkontext + min_atr_pct wird aktiv) – Proxy für die 1m-Signalzahl
+    - atr_pass: Anteil der 3m-Bars mit ATR/Close >= min_atr_pct
+    - quote_vol_daily: Median des täglichen Quote-Volumens (USDT) aus 1h-Bars
+    """
+    import numpy as np
+    import pandas as pd
+    from ..utils.indicators import ema
+
+    def wide(interval, col):
+        return pd.concat({sym: df[col] for sym, df in bars[interval].items()}, axis=1).sort_index()
+
+    close3, high3, low3 = wide("3m", "close"), wide("3m", "high"), wide("3m", "low")
+    prev_close = close3.shift(1)
+    tr = np.fmax(high3 - low3, np.fmax((high3 - prev_close).abs(), (low3 - prev_close).abs()))
+    atr3 = tr.ewm(span=params.atr_period_3m, adjust=False).mean()
+    vol_ok = (atr3 / close3) >= params.min_atr_pct
+
+    trend_up = ema(close3, params.ema_fast_3m) > ema(close3, params.ema_slow_3m)
+    trend_dn = ema(close3, params.ema_fast_3m) < ema(close3, params.ema_slow_3m)
+    votes_long = votes_short = 0
+    for key in ["15m", "30m", "1h"]:
+        trend = ema(wide(key, "close"), params.ema_trend_long).reindex(close3.index, method="ffill")
+        votes_long = votes_long + (close3 > trend).astype(int)
+        votes_short = votes_short + (close3 < trend).astype(int)
+
+    if params.trend_logic.upper() == "OR":
+        long_ctx, short_ctx = trend_up | (votes_long >= 2), trend_dn | (votes_short >= 2)
+    else:
+        long_ctx, short_ctx = trend_up & (votes_long >= 2), trend_dn & (votes_short >= 2)
+
+    setups = 0
+    for ctx in (long_ctx & vol_ok, short_ctx & vol_ok):
+        setups = setups + (ctx & ~ctx.shift(1, fill_value=False)).sum()
+
+    quote_1h = wide("1h", "close") * wide("1h", "volume")
+    quote_daily = quote_1h.resample("1D").sum(min_count=1)
+
+    out = pd.DataFrame({
+        "est_signals": setups,
+        "atr_pass": vol_ok.where(close3.notna()).mean(),
+        "quote_vol_daily": quote_daily.median(),
+        "n_bars_3m": close3.notna().sum(),
+    })
+    out.index.name = "symbol"
+    return out
+
+def _backtest_symbol(symbol, start, end, params_dict, equity, base_dir):
+    # Top-level, damit ProcessPoolExecutor (auch spawn unter Windows) es picklen kann
+    from ..backtest.engine import SimpleFuturesBacktester
+    from ..strategy.mtf_momo import Params
+    from .backtest import load_1m_csv, slice_df
+
+    t0 = time.perf_counter()
+    df = slice_df(load_1m_csv(symbol, base_dir), start, end)
+    if df.empty:
+        return None
+    bt = SimpleFuturesBacktester(equity=equity, params=Params(**params_dict))
+    _, _, m = bt.run_symbol(symbol, df)
+    m["symbol"] = symbol
+    m["backtest_sec"] = time.perf_counter() - t0
+    return m
+
+def main(argv=None, prog=None):
+    ap = argparse.ArgumentParser(prog=prog, description="Screen a symbol universe: cheap prefilter, then parallel backtests.")
+    ap.add_argument("--symbols", nargs="+", default=None, help="Default: every symbol with 1m data under --data_dir")
+    ap.add_argument("--start", required=True)
+    ap.add_argument("--end", required=True)
+    ap.add_argument("--equity", type=float, default=10000.0)
+    ap.add_argument("--params_file", type=str, default=None, help="JSON file with Params overrides")
+    ap.add_argument("--data_dir", default="data/raw/binance")
+    ap.add_argument("--min-signals", type=int, default=20, help="Min. est. setups in window")
+    ap.add_argument("--min-atr-pass", type=float, default=0.3, help="Min. share of 3m bars passing min_atr_pct")
+    ap.add_argument("--min-quote-volume", type=float, default=5e7, help="Min. median daily quote volume (USDT)")
+    ap.add_argument("--max-survivors", type=int, default=None, help="Keep only the N most liquid survivors")
+    ap.add_argument("--workers", type=int, default=None, help="Backtest processes (default: CPU count)")
+    args = ap.parse_args(argv)
+
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from ..strategy.mtf_momo import Params
+
+    params = Params()
+    if args.params_file:
+        with open(args.params_file, "r", encoding="utf-8-sig") as f:
+            params = Params(**json.load(f))
+
+    symbols = args.symbols or list_symbols(args.data_dir)
+    if not symbols:
+        print("No symbols found."); return
+
+    timings = {}
+    t_total = time.perf_counter()
+
+    # Stage 1: MTF-Bars laden (I/O-lastig → Threads)
+    t0 = time.perf_counter()
+    bars = {iv: {} for iv in PREFILTER_INTERVALS}
+    def _load(sym):
+        return sym, load_intervals(sym, args.start, args.end, base_dir=args.data_dir)
+    with ThreadPoolExecutor(max_workers=min(16, len(symbols))) as ex:
+        for sym, frames in ex.map(_load, symbols):
+            if any(df.empty for df in frames.values()):
+                print(f"No data for {sym} in selected window.")
+                continue
+            for iv, df in frames.items():
+                bars[iv][sym] = df
+    timings["load_sec"] = time.perf_counter() - t0
+    if not bars["3m"]:
+        print("No results."); return
+
+    # Stage 2: vektorisierter Vorfilter über alle Symbole
+    t0 = time.perf_counter()
+    stats = prefilter_stats(bars, params)
+    stats["passed"] = ((stats["est_signals"] >= args.min_signals)
+                       & (stats["atr_pass"] >= args.min_atr_pass)
+                       & (stats["quote_vol_daily"] >= args.min_quote_volume))
+    survivors = stats[stats["passed"]].sort_values("quote_vol_daily", ascending=False)
+    if args.max_survivors is not None:
+        survivors = survivors.head(args.max_survivors)
+    timings["prefilter_sec"] = time.perf_counter() - t0
+    print(f"Prefilter: {len(survivors)}/{len(stats)} symbols survive.")
+
+    # Stage 3: volle Backtests parallel auf den Überlebenden
+    t0 = time.perf_counter()
+    results = []
+    if len(survivors):
+        with ProcessPoolExecutor(max_workers=args.workers) as ex:
+            futures = [ex.submit(_backtest_symbol, sym, args.start, args.end, params.__dict__,
+                                 args.equity, args.data_dir) for sym in survivors.index]
+            results = [m for m in (f.result() for f in futures) if m is not None]
+    timings["backtest_sec"] = time.perf_counter() - t0
+    timings["total_sec"] = time.perf_counter() - t_total
+    timings["n_symbols"] = int(len(stats))
+    timings["n_survivors"] = int(len(survivors))
+
+    ranked = pd.DataFrame(results)
+    if not ranked.empty:
+        ranked = ranked.set_index("symbol").join(stats.drop(columns="passed")) \
+                       .sort_values(["sharpe", "total_return"], ascending=False)
+        ranked.insert(0, "rank", range(1, len(ranked) + 1))
+
+    stamp = datetime.utcnow().strftime("%Y%m%d_%H%M")
+    outdir = os.path.join("reports", "screen", stamp)
+    os.makedirs(outdir, exist_ok=True)
+    stats.to_csv(os.path.join(outdir, "prefilter.csv"))
+    ranked.to_csv(os.path.join(outdir, "universe.csv"))
+    with open(os.path.join(outdir, "timings.json"), "w", encoding="utf-8") as f:
+        json.dump(timings, f, indent=2)
+
+    print("Timings:", ", ".join(f"{k}={v:.1f}s" for k, v in timings.items() if k.endswith("_sec")))
+    print("Saved:", outdir)
+
+if __name__ == "__main__":
+    main()
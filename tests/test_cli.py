@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import pytest
+
+HEAVY = ("pandas", "numpy", "pydantic", "dotenv")
+
+# Budget für `import spongebob.cli` (kumulativ, laut -X importtime)
+IMPORT_BUDGET_US = 50_000
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+
+@pytest.mark.parametrize("argv", [[], ["--help"], ["backtest", "--help"], ["optimize", "--help"],
+                                  ["portfolio", "--help"], ["download", "--help"], ["screen", "--help"]])
+def test_help_does_not_import_heavy_modules(argv):
+    code = ("import sys\n"
+            "from spongebob.cli import main\n"
+            "try:\n"
+            f"    main({argv!r})\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print(sorted(m for m in {HEAVY!r} if m in sys.modules))")
+    out = _run(code).stdout.strip().splitlines()[-1]
+    assert out == "[]"
+
+def test_cli_import_time_budget():
+    stderr = _run("import spongebob.cli").stderr
+    cumulative = [int(line.split("|")[1]) for line in stderr.splitlines()
+                  if line.rstrip().endswith(" spongebob.cli")]
+    assert cumulative, stderr
+    assert cumulative[0] < IMPORT_BUDGET_US
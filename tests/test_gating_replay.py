@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from spongebob.backtest.engine import SimpleFuturesBacktester, Gating
+from spongebob.config import Settings
+from spongebob.strategy.mtf_momo import Params
+
+def _random_walk(n=20_000, seed=1):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2023-01-01", periods=n, freq="1min", tz="UTC")
+    c = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    return pd.DataFrame({
+        "open": c, "close": c, "volume": 1.0,
+        "high": c * (1 + rng.uniform(0, 0.004, n)),
+        "low":  c * (1 - rng.uniform(0, 0.004, n)),
+    }, index=idx)
+
+def test_replay_matches_run_symbol():
+    df = _random_walk()
+    params = Params(min_atr_pct=0.0001, min_ema_gap_pct=0.0, atr_mult_stop=0.8, tp_rr=1.0)
+    gatings = [Gating(), Gating(15), Gating(5, tuple(range(7, 23)))]
+
+    events = SimpleFuturesBacktester(params=params).record_candidates("X", df)
+    swept = SimpleFuturesBacktester(params=params).sweep_gating(events, gatings)
+
+    for g, m_sweep in zip(gatings, swept):
+        settings = Settings(cooldown_bars=g.cooldown_bars, trade_hours=list(g.trade_hours))
+        bt = SimpleFuturesBacktester(params=params, settings=settings)
+        eq, tdf, m = bt.run_symbol("X", df)
+        eq2, tdf2, _ = bt.replay(events, g)
+        assert m["n_trades"] > 0
+        assert m == m_sweep
+        assert np.array_equal(eq["equity"].to_numpy(), eq2["equity"].to_numpy())
+        assert tdf.equals(tdf2)
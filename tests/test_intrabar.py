@@ -0,0 +1,33 @@
+import os
+import pandas as pd
+from spongebob.backtest.intrabar import IntrabarResolver
+
+def _write_minute(res, symbol, minute, df):
+    path = res.minute_path(symbol, minute)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_csv(path, index=False)
+
+def test_resolve_take_first_from_1s(tmp_path):
+    res = IntrabarResolver(base_dir=str(tmp_path))
+    minute = pd.Timestamp("2023-01-01 10:05", tz="UTC")
+    secs = pd.date_range(minute, periods=3, freq="1s")
+    _write_minute(res, "BTCUSDT", minute, pd.DataFrame({
+        "open_time": secs.astype(str),
+        "high": [100.5, 102.0, 100.0],
+        "low":  [100.0, 100.5, 98.0],
+    }))
+    # Long: Take 101.5 wird vor Stop 98.5 erreicht
+    assert res.resolve("BTCUSDT", minute, 1, 98.5, 101.5) == "take"
+    # Short: Stop 101.5 zuerst
+    assert res.resolve("BTCUSDT", minute, -1, 101.5, 98.5) == "stop"
+
+def test_resolve_aggtrades_and_fallback(tmp_path):
+    res = IntrabarResolver(base_dir=str(tmp_path), subdir="aggTrades")
+    minute = pd.Timestamp("2023-01-01 10:05", tz="UTC")
+    _write_minute(res, "BTCUSDT", minute, pd.DataFrame({
+        "time": ["2023-01-01 10:05:01.200", "2023-01-01 10:05:30.000", "2023-01-01 10:05:40.000"],
+        "price": [100.0, 98.0, 102.0],
+    }))
+    assert res.resolve("BTCUSDT", minute, 1, 98.5, 101.5) == "stop"
+    # keine feineren Daten → None (Engine fällt auf Stop-zuerst zurück)
+    assert res.resolve("BTCUSDT", minute + pd.Timedelta(minutes=1), 1, 98.5, 101.5) is None
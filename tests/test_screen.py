@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+from spongebob.scripts.screen import prefilter_stats
+from spongebob.strategy.mtf_momo import Params
+from spongebob.utils.indicators import resample_ohlcv
+
+def _bars(seed, vol, volume):
+    rng = np.random.default_rng(seed)
+    n = 3 * 24 * 60
+    idx = pd.date_range("2023-01-01", periods=n, freq="1min", tz="UTC")
+    c = 100 * np.exp(np.cumsum(rng.normal(0, vol, n)))
+    df = pd.DataFrame({"open": c, "close": c, "volume": volume,
+                       "high": c * (1 + vol), "low": c * (1 - vol)}, index=idx)
+    return {iv: resample_ohlcv(df, iv.replace("m", "min")) for iv in ["3m", "15m", "30m", "1h"]}
+
+def test_prefilter_stats_per_symbol():
+    per_sym = {"CALM": _bars(0, 0.00002, 1.0), "WILD": _bars(1, 0.003, 100.0)}
+    bars = {iv: {sym: frames[iv] for sym, frames in per_sym.items()} for iv in ["3m", "15m", "30m", "1h"]}
+    stats = prefilter_stats(bars, Params(ema_trend_long=50))
+
+    assert list(stats.index) == ["CALM", "WILD"]
+    assert stats.loc["CALM", "atr_pass"] == 0.0
+    assert stats.loc["CALM", "est_signals"] == 0
+    assert stats.loc["WILD", "atr_pass"] > 0.9
+    assert stats.loc["WILD", "est_signals"] > 0
+    assert stats.loc["WILD", "quote_vol_daily"] > stats.loc["CALM", "quote_vol_daily"]